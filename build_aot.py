@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""Ahead-of-time compile the scoring kernels.
+
+Builds the `scoring_aot` extension module next to this script, so that
+`score.py` can skip Numba's JIT compilation at runtime. Run once at image
+build time:
+
+    python build_aot.py
+"""
+import os
+
+from numba.pycc import CC
+
+from scoring_kernels import auc_roc_pr
+
+cc = CC("scoring_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Compiled code does not check argument types; score.py converts its inputs
+# to these exact dtypes before calling the kernel.
+cc.export("auc_roc_pr", "UniTuple(f8, 2)(i1[::1], f8[::1])")(auc_roc_pr.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -6,65 +6,132 @@ and the `score` function to fit your specific scoring needs. You
 can add additional functions and dependencies as needed.
 """
 import json
+from typing import Optional
 
-import pandas as pd
+import numpy as np
+import pyarrow as pa
 import typer
-from sklearn.metrics import auc, precision_recall_curve, roc_auc_score
 from typing_extensions import Annotated
 
-from utils import extract_gs_file
+from utils import (
+    extract_gs_file,
+    read_goldstandard,
+    read_table,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the ahead-of-time compiled kernel (see build_aot.py), which avoids
+# JIT compilation at startup.
+try:
+    from scoring_aot import auc_roc_pr
+except ImportError:
+    from scoring_kernels import auc_roc_pr
 
 # ---- CUSTOMIZATION REQUIRED ----
 
 # Goldstandard columns and data type.
 GOLDSTANDARD_COLS = {
-    "id": str,
-    "disease": int,
+    "id": pa.string(),
+    "disease": pa.int64(),
 }
 
 # Expected columns and data types for predictions file.
 PREDICTION_COLS = {
-    "id": str,
-    "probability": float,
+    "id": pa.string(),
+    "probability": pa.float64(),
 }
 
 
-def score(gold_file: str, pred_file: str) -> dict[str, int | float]:
+def _align_predictions(
+    gold_ids: pa.ChunkedArray, pred_ids: pa.ChunkedArray, probs: pa.ChunkedArray
+) -> np.ndarray:
+    """Reorder the prediction probabilities to follow the goldstandard IDs.
+
+    IDs without a prediction are set to NaN. Raises ValueError if an ID has
+    more than one prediction.
+    """
+    # Predictions are often submitted in the same order as the goldstandard,
+    # in which case there is nothing to align.
+    if pred_ids.equals(gold_ids):
+        return probs.to_numpy()
+
+    # Otherwise, dictionary-encode the goldstandard and prediction IDs
+    # together so both share the same integer codes, then align the
+    # predictions to the goldstandard by code.
+    ids = pa.concat_arrays(gold_ids.chunks + pred_ids.chunks).dictionary_encode()
+    codes = ids.indices.to_numpy()
+    gold_codes, pred_codes = codes[: len(gold_ids)], codes[len(gold_ids) :]
+    if np.bincount(pred_codes, minlength=1).max() > 1:
+        raise ValueError("Found duplicate prediction IDs.")
+
+    values = probs.to_numpy()
+    aligned = np.full(len(ids.dictionary), np.nan, dtype=values.dtype)
+    aligned[pred_codes] = values
+    return aligned[gold_codes]
+
+
+def score(
+    gold_file: str, pred_file: str, gold_cache: str | None = None
+) -> dict[str, int | float]:
     """Sample scoring function.
 
     Metrics returned:
         - AUC-ROC
         - AUCPR
 
+    The goldstandard is loaded from `gold_cache`, if given and up to date,
+    instead of parsing `gold_file` again. The cache is never written here.
+
     !!! Note: any updates to this function must maintain the return type
     of a dictionary, where keys are the metric names and values are the
-    corresponding scores.
+    corresponding scores as native Python numbers (not NumPy scalars).
     """
-    pred = pd.read_csv(
-        pred_file,
-        usecols=PREDICTION_COLS,
-        dtype=PREDICTION_COLS,
-        float_precision="round_trip",
-    )
-    gold = pd.read_csv(
-        gold_file,
-        usecols=GOLDSTANDARD_COLS,
-        dtype=GOLDSTANDARD_COLS,
-    )
-
-    # Join the two dataframes to ensure the order of the IDs are the same
-    # between goldstandard and prediction before scoring.
-    merged = gold.merge(pred, how="left", on="id")
-    roc = roc_auc_score(merged["disease"], merged["probability"])
-    precision, recall, _ = precision_recall_curve(
-        merged["disease"], merged["probability"]
-    )
-    return {"auc_roc": roc, "auprc": auc(recall, precision)}
+    gold = read_goldstandard(gold_file, GOLDSTANDARD_COLS, gold_cache)
+
+    # AUC is only defined if both classes are present, so fail before
+    # reading the predictions if they are not.
+    labels = gold["disease"].to_numpy()
+    if labels.size == 0 or labels.min() != 0 or labels.max() != 1:
+        raise ValueError(
+            "Goldstandard labels must be 0 or 1, with both classes present."
+        )
+
+    # Ensure the order of the IDs are the same between goldstandard and
+    # prediction before scoring.
+    pred = read_table(pred_file, PREDICTION_COLS)
+    p = _align_predictions(gold["id"], pred["id"], pred["probability"])
+    if np.isnan(p).any():
+        raise ValueError("Missing or NaN predictions for some goldstandard IDs.")
+
+    # The ahead-of-time kernel does not check its argument types, so always
+    # pass the exact dtypes it was compiled for (see build_aot.py).
+    y = np.ascontiguousarray(labels, dtype=np.int8)
+    p = np.ascontiguousarray(p, dtype=np.float64)
+    roc, auprc = auc_roc_pr(y, p)
+    return {"auc_roc": float(roc), "auprc": float(auprc)}
 
 
 # ----- END OF CUSTOMIZATION -----
 
 
+def _load_json(data: bytes) -> dict:
+    """Parse JSON with orjson, if installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(obj: dict) -> bytes:
+    """Serialize JSON to bytes with orjson, if installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 def main(
     predictions_file: Annotated[
         str,
@@ -75,13 +142,34 @@ def main(
         ),
     ],
     goldstandard_folder: Annotated[
-        str,
+        Optional[str],
         typer.Option(
             "-g",
             "--goldstandard_folder",
             help="Path to the folder containing the goldstandard file.",
         ),
-    ],
+    ] = None,
+    goldstandard_file: Annotated[
+        Optional[str],
+        typer.Option(
+            "-G",
+            "--goldstandard_file",
+            help=(
+                "Path to the goldstandard file. Takes precedence over "
+                "--goldstandard_folder."
+            ),
+        ),
+    ] = None,
+    goldstandard_cache: Annotated[
+        Optional[str],
+        typer.Option(
+            "--goldstandard_cache",
+            help=(
+                "Path to a Feather copy of the parsed goldstandard written "
+                "by validate.py. Disabled by default."
+            ),
+        ),
+    ] = None,
     output_file: Annotated[
         str,
         typer.Option(
@@ -102,11 +190,16 @@ def main(
     # cause issues with ORCA. Proceed with caution.
     # ---------------------------------------------------
 
+    if goldstandard_file is None and goldstandard_folder is None:
+        raise typer.BadParameter(
+            "Either --goldstandard_file or --goldstandard_folder is required."
+        )
+
     scores = {}
     status = "INVALID"
     try:
-        with open(output_file, encoding="utf-8") as out:
-            res = json.load(out)
+        with open(output_file, "rb") as out:
+            res = _load_json(out.read())
     except (FileNotFoundError, json.decoder.JSONDecodeError):
         res = {
             "validation_status": "",
@@ -126,9 +219,9 @@ def main(
     if res.get("validation_status") == "INVALID":
         errors = "Submission could not be evaluated due to validation errors."
     else:
-        gold_file = extract_gs_file(goldstandard_folder)
+        gold_file = goldstandard_file or extract_gs_file(goldstandard_folder)
         try:
-            scores = score(gold_file, predictions_file)
+            scores = score(gold_file, predictions_file, goldstandard_cache)
             status = "SCORED"
             errors = ""
         except ValueError as err:
@@ -140,8 +233,8 @@ def main(
         "score_errors": errors,
         **scores,
     }
-    with open(output_file, "w", encoding="utf-8") as out:
-        out.write(json.dumps(res))
+    with open(output_file, "wb") as out:
+        out.write(_dump_json(res))
     print(status)
 
 
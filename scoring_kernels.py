@@ -0,0 +1,60 @@
+"""Compiled kernels used by the scoring script."""
+import numpy as np
+from numba import njit, types
+
+# Inputs are declared read-only so that both writeable arrays and read-only
+# views of Arrow/pandas buffers are accepted without a copy.
+_INT8_ARRAY = types.Array(types.int8, 1, "C", readonly=True)
+_FLOAT64_ARRAY = types.Array(types.float64, 1, "C", readonly=True)
+
+
+@njit(
+    types.UniTuple(types.float64, 2)(_INT8_ARRAY, _FLOAT64_ARRAY),
+    cache=True,
+    fastmath=True,
+)
+def auc_roc_pr(y, p):
+    """Compute AUC-ROC and AUPRC for binary labels `y` and scores `p`.
+
+    Both areas are integrated in a single pass over the predictions ranked
+    from highest to lowest probability. Tied probabilities are collapsed
+    into a single threshold and the PR curve starts at (recall=0,
+    precision=1), matching sklearn's `roc_auc_score` and `auc` over
+    `precision_recall_curve`.
+
+    `p` must not contain NaN values.
+    """
+    n = y.size
+    pos = 0
+    for i in range(n):
+        pos += y[i]
+    neg = n - pos
+    if pos == 0 or neg == 0:
+        raise ValueError(
+            "Only one class present in y_true. ROC AUC score is not defined "
+            "in that case."
+        )
+
+    order = np.argsort(-p, kind="mergesort")
+    tp = 0
+    fp = 0
+    prev_tp = 0
+    prev_fp = 0
+    prev_precision = 1.0
+    roc = 0.0
+    pr = 0.0
+    for i in range(n):
+        idx = order[i]
+        tp += y[idx]
+        fp += 1 - y[idx]
+        if i + 1 < n and p[order[i + 1]] == p[idx]:
+            continue
+
+        # Accumulate unnormalized trapezoids; rates are divided out below.
+        precision = tp / (tp + fp)
+        roc += (fp - prev_fp) * float(tp + prev_tp)
+        pr += (tp - prev_tp) * (precision + prev_precision)
+        prev_tp = tp
+        prev_fp = fp
+        prev_precision = precision
+    return roc / (2.0 * pos * neg), pr / (2.0 * pos)
@@ -1,17 +1,168 @@
 import os
-from glob import glob
+import uuid
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 
 
 def extract_gs_file(folder):
     """Extract goldstandard file from folder."""
-    files = glob(os.path.join(folder, "*"))
+    gs_file = None
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            # Skip hidden files and the manifest file
+            if (
+                entry.name.startswith(".")
+                or entry.name == "SYNAPSE_METADATA_MANIFEST.tsv"
+            ):
+                continue
+            if gs_file is not None:
+                raise ValueError(
+                    "Expected exactly one goldstandard file in folder. "
+                    "Got more than one. Exiting."
+                )
+            gs_file = entry.path
 
-    # Filter out the manifest file
-    files = [f for f in files if os.path.basename(f) != 'SYNAPSE_METADATA_MANIFEST.tsv']
-    
-    if len(files) != 1:
+    if gs_file is None:
         raise ValueError(
-            "Expected exactly one goldstandard file in folder. "
-            f"Got {len(files)}. Exiting."
+            "Expected exactly one goldstandard file in folder. Got 0. Exiting."
+        )
+    return gs_file
+
+
+def _csv_options(columns):
+    """Build the Arrow CSV options for reading the given columns."""
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+    convert_options = pacsv.ConvertOptions(
+        include_columns=list(columns),
+        column_types=columns,
+    )
+    return read_options, convert_options
+
+
+def read_table(csv_file, columns):
+    """Read the given columns of a CSV file (path or Arrow file) into a table.
+
+    `columns` maps each column name to its Arrow data type. Any additional
+    columns in the file are ignored. Raises ValueError if a column is
+    missing or cannot be converted to the expected type.
+    """
+    read_options, convert_options = _csv_options(columns)
+    try:
+        return pacsv.read_csv(
+            csv_file,
+            read_options=read_options,
+            convert_options=convert_options,
         )
-    return files[0]
+    except pa.ArrowKeyError as err:
+        # Keep the same exception type as a failed conversion.
+        raise ValueError(str(err)) from err
+
+
+def iter_batches(csv_file, columns):
+    """Stream the given columns of a CSV file as Arrow record batches.
+
+    Same as `read_table`, but only one block of the file is held in memory
+    at a time. A missing column is reported before any batch is yielded;
+    conversion errors are raised when the offending batch is read.
+    """
+    read_options, convert_options = _csv_options(columns)
+    try:
+        reader = pacsv.open_csv(
+            csv_file,
+            read_options=read_options,
+            convert_options=convert_options,
+        )
+    except pa.ArrowKeyError as err:
+        # Keep the same exception type as a failed conversion.
+        raise ValueError(str(err)) from err
+    yield from reader
+
+
+def _file_signature(path):
+    """Identify the version of a file by its location, size and mtime."""
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+
+def _read_cache(cache_file, schema):
+    """Memory-map a cached table, or return None if it can't be used.
+
+    A missing, unreadable, or invalid cache file, or one whose schema does
+    not match `schema` (including metadata), is treated as a cache miss.
+    """
+    try:
+        source = pa.memory_map(cache_file)
+    except OSError:
+        return None
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        table = None
+    if table is not None and table.schema.equals(schema, check_metadata=True):
+        # The table is backed by the memory map, so leave it open.
+        return table
+    del table
+    source.close()
+    return None
+
+
+def read_goldstandard(gold_file, columns, cache_file=None, write_cache=False):
+    """Read the goldstandard file, reusing a cached Feather copy if possible.
+
+    If `cache_file` was written from the current version of `gold_file`
+    with the expected columns, it is memory-mapped instead of parsing the
+    CSV again. Otherwise the CSV is parsed and, if `write_cache` is set,
+    written to `cache_file` (uncompressed) for later runs.
+    """
+    try:
+        signature = _file_signature(gold_file)
+    except OSError as err:
+        raise ValueError(f"Could not read goldstandard file: {err}") from err
+    schema = pa.schema(columns, metadata={"source": signature})
+    if cache_file is not None:
+        table = _read_cache(cache_file, schema)
+        if table is not None:
+            return table
+
+    table = _parse_goldstandard(gold_file, columns)
+    table = table.replace_schema_metadata(schema.metadata)
+    if cache_file is not None and write_cache:
+        _write_feather_atomic(table, cache_file)
+    return table
+
+
+def _parse_goldstandard(gold_file, columns):
+    """Parse the goldstandard CSV, raising ValueError on I/O failures.
+
+    Regular files are parsed straight from a memory map so that repeated
+    runs are served from the OS page cache. The parsed table owns its
+    buffers, so the map is closed right after. Anything else is not mapped
+    and is read from its path instead.
+    """
+    try:
+        if not os.path.isfile(gold_file):
+            return read_table(gold_file, columns)
+        with pa.memory_map(gold_file) as source:
+            return read_table(source, columns)
+    except OSError as err:
+        raise ValueError(f"Could not read goldstandard file: {err}") from err
+
+
+def _write_feather_atomic(table, path):
+    """Write `table` to `path` as uncompressed Feather, replacing it atomically.
+
+    The file is written under a temporary name in the same folder and then
+    renamed over `path`, so other processes that have memory-mapped the old
+    file never see it truncated or half-written. Like a regular write, the
+    file permissions follow the umask.
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    try:
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -6,30 +6,104 @@ and the `validate` function to fit your specific validation needs.
 You can add additional functions and dependencies as needed.
 """
 import json
+from collections.abc import Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
 
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import typer
-from cnb_tools import validation_toolkit as vtk
 from typing_extensions import Annotated
 
-from utils import extract_gs_file
+from utils import (
+    extract_gs_file,
+    iter_batches,
+    read_goldstandard,
+)
 
 # ---- CUSTOMIZATION REQUIRED ----
 
 # Goldstandard columns and data type.
 GOLDSTANDARD_COLS = {
-    "id": str,
-    "disease": int,
+    "id": pa.string(),
+    "disease": pa.int64(),
 }
 
 # Expected columns and data types for predictions file.
 PREDICTION_COLS = {
-    "id": str,
-    "probability": float,
+    "id": pa.string(),
+    "probability": pa.float64(),
 }
 
 
-def validate(gold_file: str, pred_file: str) -> list[str]:
+def _check_values(
+    pred_batches: Iterable[pa.RecordBatch], fail_fast: bool = False
+) -> tuple[pa.ChunkedArray, list[str]]:
+    """Check prediction values in a single pass over the predictions.
+
+    Predictions are consumed one record batch at a time, so only the
+    prediction IDs (kept as Arrow strings) are held in memory. With
+    `fail_fast`, reading stops after the first batch with an invalid value.
+
+    Returns the prediction IDs read and one message per check, in the same
+    wording as the `cnb_tools` validation toolkit; empty strings signify a
+    passing check.
+    """
+    pred_id_chunks = []
+    nan_count = 0
+    out_of_range = False
+    for batch in pred_batches:
+        pred_id_chunks.append(batch.column("id"))
+
+        probs = batch.column("probability").to_numpy(zero_copy_only=False)
+        nan_count += np.count_nonzero(np.isnan(probs))
+        out_of_range = out_of_range or np.any((probs < 0) | (probs > 1))
+        if fail_fast and (nan_count or out_of_range):
+            break
+
+    pred_ids = pa.chunked_array(pred_id_chunks, type=PREDICTION_COLS["id"])
+    return pred_ids, [
+        (
+            f"'probability' column contains {nan_count} NaN value(s)."
+            if nan_count
+            else ""
+        ),
+        "'probability' values should be between [0, 1]." if out_of_range else "",
+    ]
+
+
+def _check_ids(
+    gold_ids: pa.ChunkedArray, pred_ids: pa.ChunkedArray, executor: Executor
+) -> list[str]:
+    """Check prediction IDs against the goldstandard IDs.
+
+    The unknown ID lookup runs on `executor` alongside the duplicate and
+    missing ID checks, which both need the unique prediction IDs.
+
+    Returns one message per check, in the same wording as the `cnb_tools`
+    validation toolkit; empty strings signify a passing check.
+    """
+    gold_ids = gold_ids.combine_chunks()
+    unknown = executor.submit(pc.is_in, pred_ids, value_set=gold_ids)
+    unique_ids = pc.unique(pred_ids)
+    duplicates = len(pred_ids) - len(unique_ids)
+    missing = pc.is_in(gold_ids, value_set=unique_ids).false_count
+    unknown = sum(chunk.false_count for chunk in unknown.result().chunks)
+
+    return [
+        f"Found {duplicates} duplicate ID(s)" if duplicates else "",
+        f"Found {missing} missing ID(s)" if missing else "",
+        f"Found {unknown} unknown ID(s)" if unknown else "",
+    ]
+
+
+def validate(
+    gold_file: str,
+    pred_file: str,
+    gold_cache: str | None = None,
+    fail_fast: bool = False,
+) -> list[str]:
     """Sample validation function.
 
     Checks include:
@@ -43,42 +117,44 @@ def validate(gold_file: str, pred_file: str) -> list[str]:
     Returns a list of error messages. An empty list signifies successful
     validation.
 
+    The parsed goldstandard is saved to `gold_cache`, if given, so that
+    scoring does not need to parse it again. Set `fail_fast` when only the
+    validation status is needed; checking stops at the first error found.
+
     !!! Note: any updates to this function must maintain the return type
     of a list of strings.
     """
     errors = []
-    gold = pd.read_csv(
-        gold_file,
-        usecols=GOLDSTANDARD_COLS,
-        dtype=GOLDSTANDARD_COLS,
-    )
-    try:
-        pred = pd.read_csv(
-            pred_file,
-            usecols=PREDICTION_COLS,
-            dtype=PREDICTION_COLS,
-            float_precision="round_trip",
-        )
-    except ValueError as err:
-        errors.append(
-            f"Invalid column names and/or types: {str(err)}. "
-            f"Expecting: {str(PREDICTION_COLS)}."
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Parse the goldstandard in the background while the predictions
+        # are streamed; Arrow releases the GIL for both.
+        gold = executor.submit(
+            read_goldstandard,
+            gold_file,
+            GOLDSTANDARD_COLS,
+            gold_cache,
+            write_cache=True,
         )
-    else:
-        errors.append(vtk.check_duplicate_keys(pred["id"]))
-        errors.append(vtk.check_missing_keys(gold["id"], pred["id"]))
-        errors.append(vtk.check_unknown_keys(gold["id"], pred["id"]))
-        errors.append(vtk.check_nan_values(pred["probability"]))
-        errors.append(
-            vtk.check_values_range(
-                pred["probability"],
-                min_val=0,
-                max_val=1,
+        try:
+            pred_ids, value_errors = _check_values(
+                iter_batches(pred_file, PREDICTION_COLS), fail_fast=fail_fast
             )
-        )
+        except ValueError as err:
+            expected = {name: str(t) for name, t in PREDICTION_COLS.items()}
+            errors.append(
+                f"Invalid column names and/or types: {str(err)}. "
+                f"Expecting: {str(expected)}."
+            )
+        else:
+            if not (fail_fast and any(value_errors)):
+                errors.extend(_check_ids(gold.result()["id"], pred_ids, executor))
+            errors.extend(value_errors)
+
+        # Surface any error from reading the goldstandard.
+        gold.result()
 
     # Remove any empty strings from the list before return.
-    return filter(None, errors)
+    return [error for error in errors if error]
 
 
 # ----- END OF CUSTOMIZATION -----
@@ -94,13 +170,34 @@ def main(
         ),
     ],
     goldstandard_folder: Annotated[
-        str,
+        Optional[str],
         typer.Option(
             "-g",
             "--goldstandard_folder",
             help="Path to the folder containing the goldstandard file.",
         ),
-    ],
+    ] = None,
+    goldstandard_file: Annotated[
+        Optional[str],
+        typer.Option(
+            "-G",
+            "--goldstandard_file",
+            help=(
+                "Path to the goldstandard file. Takes precedence over "
+                "--goldstandard_folder."
+            ),
+        ),
+    ] = None,
+    goldstandard_cache: Annotated[
+        Optional[str],
+        typer.Option(
+            "--goldstandard_cache",
+            help=(
+                "Path to save a Feather copy of the parsed goldstandard for "
+                "reuse by score.py. Disabled by default."
+            ),
+        ),
+    ] = None,
     output_file: Annotated[
         str,
         typer.Option(
@@ -118,12 +215,21 @@ def main(
     # cause issues with ORCA. Proceed with caution.
     # ---------------------------------------------------
 
+    if goldstandard_file is None and goldstandard_folder is None:
+        raise typer.BadParameter(
+            "Either --goldstandard_file or --goldstandard_folder is required."
+        )
+
     if "INVALID" in predictions_file:
         with open(predictions_file, encoding="utf-8") as f:
             errors = [f.read()]
     else:
-        gold_file = extract_gs_file(goldstandard_folder)
-        errors = validate(gold_file=gold_file, pred_file=predictions_file)
+        gold_file = goldstandard_file or extract_gs_file(goldstandard_folder)
+        errors = validate(
+            gold_file=gold_file,
+            pred_file=predictions_file,
+            gold_cache=goldstandard_cache,
+        )
 
     invalid_reasons = "\n".join(errors)
     status = "INVALID" if invalid_reasons else "VALIDATED"